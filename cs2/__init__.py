@@ -0,0 +1,47 @@
+"""
+cs2
+Brodie Rogers <brodie.rogers@students.cune.edu
+
+Data structures, sorting algorithms and exercises from the CS2 projects
+collected into one package.
+
+Usage:
+    from cs2 import Array, Stack, SortingArray, InfixPostfix
+    arr = SortingArray.random(1000)
+    arr.heap_sort()
+
+Names are imported from their submodule the first time they are used, so
+"import cs2" is cheap and the command line tools start quickly.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "Array": "csarray",
+    "ArrayView": "csarray",
+    "DynamicArray": "csarray",
+    "SharedArray": "csarray",
+    "OperationCounts": "csarray",
+    "Stack": "csstack",
+    "SortingArray": "sorting_array",
+    "InfixPostfix": "infix_postfix",
+    "has_nearby_duplicate": "p2",
+    "majority_element": "p3",
+    "path_sum": "p4",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import name from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
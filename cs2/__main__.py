@@ -0,0 +1,60 @@
+"""
+Command line tools for the cs2 package.
+
+Usage:
+    python -m cs2 sort [--algorithm heap] [FILE]
+        Sort the numbers in FILE (or stdin), one per line.
+    python -m cs2 postfix EXPRESSION [EXPRESSION ...]
+        Convert infix expressions to postfix.
+"""
+
+import argparse
+import sys
+
+# Command line name -> SortingArray method
+ALGORITHMS = {
+    "insertion": "insertion_sort",
+    "shell": "shell_sort",
+    "heap": "heap_sort",
+    "quick": "itter_insert_quick_sort",
+}
+
+
+def sort_command(args):
+    from .sorting_array import SortingArray
+
+    lines = args.file.read().split()
+    numbers = [float(n) if "." in n else int(n) for n in lines]
+    arr = SortingArray(numbers)
+    getattr(arr, ALGORITHMS[args.algorithm])()
+    if len(arr):
+        print("\n".join(str(n) for n in arr))
+
+
+def postfix_command(args):
+    from .infix_postfix import InfixPostfix
+
+    converter = InfixPostfix()
+    for infix in args.expressions:
+        print(converter.infix_to_postfix(infix))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="cs2")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sort_parser = commands.add_parser("sort", help="sort numbers, one per line")
+    sort_parser.add_argument("file", nargs="?", type=argparse.FileType("r"), default=sys.stdin)
+    sort_parser.add_argument("--algorithm", choices=ALGORITHMS, default="quick")
+    sort_parser.set_defaults(run=sort_command)
+
+    postfix_parser = commands.add_parser("postfix", help="convert infix to postfix")
+    postfix_parser.add_argument("expressions", nargs="+")
+    postfix_parser.set_defaults(run=postfix_command)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
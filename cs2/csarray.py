@@ -0,0 +1,750 @@
+# csarray.py
+# Marcus Gubanyi
+# 2025.01.14
+# Defines a simple array class with only basic behaviors.
+# The purpose of this class is to work with a simple
+# sequential, indexed data structure without the additional
+# behaviors of a python list.
+#
+# Usage:
+# from cs2.csarray import Array
+# a = Array(data = [2,3,4])
+# b = Array(size = 1000000, typecode = 'q')   # compact typed storage
+# c = Array.open_mmap("data.bin", 'q', 10**8)  # file-backed storage
+# c.close()
+# v = a[1:3]                                   # view sharing a's buffer
+# r = Array.random(1000, 0, 100, seed = 1)     # bulk construction
+# d = DynamicArray(); d.append(5)              # growable array
+# b.save("b.arr"); b = Array.load("b.arr")     # binary save and load
+# s = SharedArray(size = 1000, typecode = 'q') # shared between processes
+# s.close()
+# counts = a.instrument(); ...; print(counts)  # count element operations
+
+from array import array
+import mmap
+import os
+import random
+import struct
+import sys
+
+# Header of a saved Array: magic, typecode, padding, element count.
+# The 16 byte header keeps the element data 8 byte aligned.
+_MAGIC = b"CSAR"
+_HEADER = struct.Struct("<4sc3xQ")
+
+
+def _rebuild(cls, typecode, buffer):
+    """Recreate a pickled typed Array from its raw element bytes."""
+    data = array(typecode)
+    data.frombytes(memoryview(buffer).cast('B'))
+    return cls(data, typecode = typecode)
+
+
+class OperationCounts():
+    """Tally of the element operations done on an instrumented Array."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Set every count back to zero."""
+        self.reads = 0
+        self.writes = 0
+        self.comparisons = 0
+        self.swaps = 0
+
+    def __str__(self):
+        return (f"reads={self.reads} writes={self.writes} "
+                f"comparisons={self.comparisons} swaps={self.swaps}")
+
+
+class _Counted():
+    """Element read from an InstrumentedBuffer that counts comparisons.
+
+    It remembers the index it was read from so the buffer can tell when
+    two writes exchange a pair of elements.
+    """
+    __slots__ = ("value", "index", "counts")
+
+    def __init__(self, value, index, counts):
+        self.value = value
+        self.index = index
+        self.counts = counts
+
+    def _compare(self, other):
+        self.counts.comparisons += 1
+        return other.value if isinstance(other, _Counted) else other
+
+    def __lt__(self, other):
+        return self.value < self._compare(other)
+
+    def __le__(self, other):
+        return self.value <= self._compare(other)
+
+    def __gt__(self, other):
+        return self.value > self._compare(other)
+
+    def __ge__(self, other):
+        return self.value >= self._compare(other)
+
+    def __eq__(self, other):
+        return self.value == self._compare(other)
+
+    def __ne__(self, other):
+        return self.value != self._compare(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class InstrumentedBuffer():
+    """Wraps an Array's backing buffer and counts every element access.
+
+    A swap is counted when two writes in a row exchange the elements at
+    two positions, which covers both tuple swaps and swaps via a temp.
+    Slices are passed through to the buffer as plain values, counting
+    one read or write per element, so fill(), extend() and the growing
+    of a DynamicArray keep working while instrumented.
+    """
+    def __init__(self, data, counts):
+        self._data = data
+        self._counts = counts
+        self._last_write = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            values = self._data[index]
+            self._counts.reads += len(values)
+            return values
+        self._counts.reads += 1
+        if index < 0:
+            index += len(self._data)
+        return _Counted(self._data[index], index, self._counts)
+
+    def __setitem__(self, index, new_value):
+        counts = self._counts
+        if isinstance(index, slice):
+            if not isinstance(new_value, array):
+                new_value = [value.value if isinstance(value, _Counted) else value
+                             for value in new_value]
+            counts.writes += len(new_value)
+            self._last_write = None
+            self._data[index] = new_value
+            return
+        counts.writes += 1
+        if index < 0:
+            index += len(self._data)
+        source = None
+        if isinstance(new_value, _Counted):
+            source = new_value.index
+            new_value = new_value.value
+        if self._last_write == (source, index):
+            counts.swaps += 1
+            self._last_write = None
+        else:
+            self._last_write = (index, source)
+        self._data[index] = new_value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def extend(self, values):
+        self._counts.writes += len(values)
+        self._data.extend(values)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        self._counts.reads += len(self._data)
+        return iter(self._data)
+
+    def tolist(self):
+        return list(self._data)
+
+    def __str__(self):
+        return str(self.tolist())
+
+
+class Array():
+    """Array object with a fixed size.
+
+    Supports setting and getting values with 0-based indices.
+    """
+    def __init__(self, data = None, size = 0, default = 0, typecode = None):
+        """Initialize an Array object.
+        Usage:
+        arr1 = Array([2,3,4])
+        arr2 = Array(size = 3, default = 4)
+              -> array contains [4,4,4]
+        arr3 = Array(size = 3, typecode = 'q')
+              -> array contains [0,0,0] stored as contiguous 64-bit ints
+
+        typecode is any code from the standard array module ('i', 'q',
+        'd', ...). When given, the elements are stored unboxed in one
+        contiguous buffer instead of a list of python objects.
+        """
+        self._typecode = typecode
+        self._mmap = None
+        if typecode is None:
+            self._data = data if data is not None else []
+            while len(self._data) < size:
+                self._data.append(default)
+        else:
+            if isinstance(data, array) and data.typecode == typecode:
+                self._data = data
+            else:
+                self._data = array(typecode, data if data is not None else [])
+            if len(self._data) < size:
+                self._data.extend(array(typecode, [default]) * (size - len(self._data)))
+
+    @classmethod
+    def random(cls, size, low = 0, high = 100, seed = None, typecode = None):
+        """Return an Array of size random ints in [low, high].
+        Usage:
+        arr = Array.random(10, 0, 100, seed = 7)
+
+        The values are generated in one batch, which is far faster than
+        calling random.randint once per element.
+        """
+        rng = random.Random(seed)
+        return cls(rng.choices(range(low, high + 1), k = size), typecode = typecode)
+
+    @classmethod
+    def ascending(cls, size, typecode = None):
+        """Return an Array containing 0, 1, ..., size - 1."""
+        values = range(size)
+        if typecode is None:
+            values = list(values)
+        return cls(values, typecode = typecode)
+
+    @classmethod
+    def descending(cls, size, typecode = None):
+        """Return an Array containing size, size - 1, ..., 1."""
+        values = range(size, 0, -1)
+        if typecode is None:
+            values = list(values)
+        return cls(values, typecode = typecode)
+
+    @classmethod
+    def from_buffer(cls, buffer, typecode = None):
+        """Return an Array that shares memory with an existing buffer.
+        Usage:
+        arr = Array.from_buffer(bytearray(80), 'q')
+              -> 10 64-bit ints backed by the bytearray
+
+        Any object supporting the buffer protocol works (bytes,
+        bytearray, array.array, mmap, ...). No data is copied.
+        """
+        view = memoryview(buffer)
+        if typecode is not None and view.format != typecode:
+            view = view.cast('B').cast(typecode)
+        arr = cls(typecode = view.format)
+        arr._data = view
+        return arr
+
+    def fill(self, value, start = 0, stop = None):
+        """Set every element in [start, stop) to value in one operation.
+        Usage: arr.fill(0)
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        count = max(0, stop - start)
+        if self._typecode is None:
+            self._data[start:start + count] = [value] * count
+        else:
+            self._data[start:start + count] = array(self._typecode, [value]) * count
+
+    def _buffer(self, typecode):
+        """Return the elements as one contiguous buffer of typecode."""
+        if self._typecode == typecode:
+            return self._raw_data()
+        return array(typecode, self)
+
+    def _raw_data(self):
+        """Return the backing buffer, without any InstrumentedBuffer."""
+        if isinstance(self._data, InstrumentedBuffer):
+            return self._data._data
+        return self._data
+
+    def save(self, path, typecode = None):
+        """Write the array to path in a compact binary format.
+        Usage: arr.save("random-1000000.arr")
+
+        The file is a short header (typecode and length) followed by the
+        raw element bytes in native byte order. Untyped arrays are saved
+        with typecode, or when it is not given as doubles ('d') if any
+        element is a float and as 64-bit ints ('q') otherwise.
+        """
+        if typecode is None and self._typecode is None:
+            typecode = 'd' if any(isinstance(value, float) for value in self) else 'q'
+        typecode = typecode or self._typecode
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, typecode.encode(), len(self)))
+            file.write(self._buffer(typecode))
+
+    @classmethod
+    def load(cls, path):
+        """Return the Array stored in path by save().
+        Usage: arr = Array.load("random-1000000.arr")
+        """
+        with open(path, "rb") as file:
+            magic, typecode, size = _HEADER.unpack(file.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a saved Array.")
+            typecode = typecode.decode()
+            data = array(typecode)
+            data.fromfile(file, size)
+        return cls(data, typecode = typecode)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle typed arrays as one raw buffer instead of per element.
+
+        With protocol 5 the buffer is passed out-of-band, so it can be
+        shipped to another process without an extra copy.
+        """
+        if self._typecode is None:
+            return super().__reduce_ex__(protocol)
+        buffer = self._buffer(self._typecode)
+        if protocol >= 5:
+            import pickle
+            buffer = pickle.PickleBuffer(buffer)
+        else:
+            buffer = bytes(buffer)
+        return (_rebuild, (type(self), self._typecode, buffer))
+
+    @classmethod
+    def open_mmap(cls, path, typecode, size = None):
+        """Return an Array whose elements live in the binary file at path.
+        Usage:
+        arr = Array.open_mmap("data.bin", 'q', 1000)
+              -> data.bin is created or grown to 1000 64-bit ints
+        arr = Array.open_mmap("data.bin", 'q')
+              -> size is taken from the existing file
+
+        The file is mapped into memory, so only the pages that are
+        touched are read from disk. Writes go back to the file when the
+        array is flushed or closed.
+        """
+        itemsize = array(typecode).itemsize
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        with open(path, mode) as file:
+            if size is None:
+                size = os.fstat(file.fileno()).st_size // itemsize
+            if size <= 0:
+                raise ValueError("Cannot map an empty array.")
+            if os.fstat(file.fileno()).st_size < size * itemsize:
+                file.truncate(size * itemsize)
+            mapped = mmap.mmap(file.fileno(), size * itemsize)
+
+        arr = cls(typecode = typecode)
+        arr._mmap = mapped
+        arr._data = memoryview(mapped).cast(typecode)
+        return arr
+
+    def flush(self):
+        """Write any changes of a file-backed array to disk."""
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self):
+        """Flush and unmap a file-backed array. Does nothing otherwise."""
+        if self._mmap is not None:
+            self.uninstrument()
+            self._mmap.flush()
+            self._data.release()
+            self._mmap.close()
+            self._mmap = None
+            self._data = array(self._typecode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def instrument(self):
+        """Start counting reads, writes, comparisons and swaps.
+        Usage:
+        counts = arr.instrument()
+        arr.heap_sort()
+        print(counts)      -> reads=... writes=... comparisons=... swaps=...
+
+        Returns the OperationCounts that accumulate until uninstrument()
+        is called. Arrays that are not instrumented pay nothing.
+        """
+        if not isinstance(self._data, InstrumentedBuffer):
+            self._data = InstrumentedBuffer(self._data, OperationCounts())
+        return self._data._counts
+
+    def uninstrument(self):
+        """Stop counting and return the final OperationCounts."""
+        counts = self.counters
+        if counts is not None:
+            self._data = self._data._data
+        return counts
+
+    @property
+    def counters(self):
+        """Return the OperationCounts, or None when not instrumented."""
+        if isinstance(self._data, InstrumentedBuffer):
+            return self._data._counts
+        return None
+
+    @property
+    def typecode(self):
+        """Return the typecode of the backing buffer, or None for a list."""
+        return self._typecode
+
+    def __setitem__(self, index, new_value):
+        """Set element with subscript index to new_value.
+        Usage: arr[2] = 3.14
+        """
+        self._data[index] = new_value
+
+    def __getitem__(self, index):
+        """Return the element at subscript index.
+        Usage: arr[2]
+               arr[1:5] -> ArrayView sharing this array's buffer
+        """
+        if isinstance(index, slice):
+            return ArrayView(self._data, range(len(self._data))[index], self._typecode)
+        return self._data[index]
+
+    def __str__(self):
+        if self._typecode is not None:
+            return str(self._data.tolist())
+        return str(self._data)
+
+    def __len__(self):
+        """Return the size of the array.
+        Usage: len(arr)
+        """
+        return len(self._data)
+
+    def __iter__(self):
+        """Iterator for the array object. Used for in operator in if and for."""
+        return iter(self._data)
+            
+
+class ArrayView(Array):
+    """Window onto a range of another Array's elements.
+
+    Reads and writes go straight to the parent buffer, so taking a view
+    never copies data. The range may have any start, stop and step.
+    """
+    def __init__(self, data, indices, typecode = None):
+        """Initialize a view of data at the positions in indices.
+        Usage:
+        view = arr[2:10]      -> offset 2, length 8
+        view = arr[1::4]      -> every 4th element starting at 1
+        """
+        self._data = data
+        self._indices = indices
+        self._typecode = typecode
+        self._mmap = None
+
+    @property
+    def offset(self):
+        """Return the parent index of the first element."""
+        return self._indices.start
+
+    @property
+    def stride(self):
+        """Return the distance between elements in the parent."""
+        return self._indices.step
+
+    def __setitem__(self, index, new_value):
+        if isinstance(index, slice):
+            positions = self._indices[index]
+            if len(new_value) != len(positions):
+                raise ValueError("Slice assignment cannot change the size of a view.")
+            for i, value in zip(positions, new_value):
+                self._data[i] = value
+        else:
+            self._data[self._indices[index]] = new_value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArrayView(self._data, self._indices[index], self._typecode)
+        return self._data[self._indices[index]]
+
+    def fill(self, value, start = 0, stop = None):
+        data = self._data
+        for i in self._indices[start:stop]:
+            data[i] = value
+
+    def _buffer(self, typecode):
+        return array(typecode, self)
+
+    def __reduce_ex__(self, protocol):
+        # A view cannot share its parent across a pickle, so copy it out.
+        return Array(list(self), typecode = self._typecode).__reduce_ex__(protocol)
+
+    def __str__(self):
+        return str(list(self))
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __iter__(self):
+        data = self._data
+        return (data[i] for i in self._indices)
+
+
+class DynamicArray(Array):
+    """Array that grows as elements are appended.
+
+    The backing Array keeps spare capacity beyond the logical length and
+    doubles when it runs out, so appends cost amortized O(1).
+    """
+    def __init__(self, data = None, capacity = 0, default = 0, typecode = None):
+        """Initialize a DynamicArray object.
+        Usage:
+        arr1 = DynamicArray([2,3,4])
+        arr2 = DynamicArray(capacity = 1000, typecode = 'q')
+              -> empty, room for 1000 ints before growing
+
+        data is copied, because growing pads the storage with default
+        and that must not show up in the caller's list.
+        """
+        if data is not None:
+            data = list(data) if typecode is None else array(typecode, data)
+        super().__init__(data, typecode = typecode)
+        self._default = default
+        self._size = len(self._data)
+        self.reserve(capacity)
+
+    @classmethod
+    def from_buffer(cls, buffer, typecode = None):
+        """Not supported: a DynamicArray cannot grow a buffer it shares."""
+        raise TypeError("DynamicArray cannot share a buffer; use Array.from_buffer.")
+
+    @classmethod
+    def open_mmap(cls, path, typecode, size = None):
+        """Not supported: a DynamicArray cannot grow a mapped file."""
+        raise TypeError("DynamicArray cannot map a file; use Array.open_mmap.")
+
+    @property
+    def capacity(self):
+        """Return the number of elements that fit before the next grow."""
+        return len(self._data)
+
+    def _resize(self, capacity):
+        """Grow or shrink the backing storage to exactly capacity slots."""
+        extra = capacity - len(self._data)
+        if extra > 0:
+            if self._typecode is None:
+                self._data.extend([self._default] * extra)
+            else:
+                self._data.extend(array(self._typecode, [self._default]) * extra)
+        elif extra < 0:
+            del self._data[capacity:]
+
+    def reserve(self, capacity):
+        """Make sure at least capacity elements fit without growing."""
+        if capacity > len(self._data):
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """Release any spare capacity."""
+        self._resize(self._size)
+
+    def append(self, item):
+        """Add item to the end, doubling the capacity when full."""
+        if self._size == len(self._data):
+            self._resize(max(1, 2 * self._size))
+        self._data[self._size] = item
+        self._size += 1
+
+    def extend(self, items):
+        """Add every element of items to the end."""
+        if not hasattr(items, "__len__"):
+            for item in items:
+                self.append(item)
+            return
+        needed = self._size + len(items)
+        if needed > len(self._data):
+            self._resize(max(needed, 2 * self._size))
+        if self._typecode is None:
+            self._data[self._size:needed] = list(items)
+        else:
+            self._data[self._size:needed] = array(self._typecode, items)
+        self._size = needed
+
+    def _buffer(self, typecode):
+        if self._typecode == typecode:
+            return self._raw_data()[:self._size]
+        return array(typecode, self)
+
+    def pop(self):
+        """Remove and return the last element."""
+        if self._size == 0:
+            raise IndexError("pop from empty DynamicArray")
+        self._size -= 1
+        item = self._data[self._size]
+        # Drop the reference so popped objects can be freed
+        self._data[self._size] = self._default
+        return item
+
+    def clear(self):
+        """Remove all elements but keep the capacity."""
+        self._size = 0
+
+    def truncate(self, size):
+        """Remove every element from index size on, keeping the capacity."""
+        if size < self._size:
+            self._size = max(0, size)
+
+    def __setitem__(self, index, new_value):
+        if isinstance(index, slice):
+            view = self[index]
+            view[:] = new_value
+        else:
+            self._data[range(self._size)[index]] = new_value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArrayView(self._data, range(self._size)[index], self._typecode)
+        return self._data[range(self._size)[index]]
+
+    def __str__(self):
+        return str(list(self))
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        data = self._data
+        return (data[i] for i in range(self._size))
+
+
+class SharedArray(Array):
+    """Typed Array whose buffer lives in a named shared memory block.
+
+    Other processes attach to the same block by name and read and write
+    the elements in place. Pickling a SharedArray sends only the name,
+    so it can be passed to a process pool without copying the data.
+
+    The creating process owns the block: close() detaches and, for the
+    owner, also frees it. Attached processes only detach.
+    """
+    def __init__(self, data = None, size = 0, default = 0, typecode = None):
+        """Initialize a SharedArray in a new shared memory block.
+        Usage:
+        arr1 = SharedArray([2,3,4], typecode = 'i')
+        arr2 = SharedArray(size = 10**7)
+              -> typecode defaults to 64-bit ints ('q')
+        """
+        from multiprocessing import shared_memory
+
+        if typecode is None:
+            typecode = 'q'
+        values = array(typecode, data if data is not None else [])
+        size = max(size, len(values))
+        shm = shared_memory.SharedMemory(create = True, size = max(values.itemsize, size * values.itemsize))
+        self._attach(shm, typecode, size, owner = True)
+        self._data[:len(values)] = values
+        self.fill(default, len(values))
+
+    def _attach(self, shm, typecode, size, owner):
+        self._shm = shm
+        self._owner = owner
+        self._typecode = typecode
+        self._mmap = None
+        self._view = shm.buf.cast(typecode)
+        self._data = self._view[:size]
+
+    @classmethod
+    def attach(cls, name, typecode, size):
+        """Return a SharedArray using the existing block called name.
+        Usage: arr = SharedArray.attach(name, 'q', 10**7)
+        """
+        from multiprocessing import resource_tracker, shared_memory
+
+        # Only the owner should be tracked, or the block is freed when
+        # the first attached process exits.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name = name, track = False)
+        else:
+            # 3.12 always registers, and unregistering afterwards races
+            # with pool workers that share the owner's tracker, so skip
+            # the registration while attaching.
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                shm = shared_memory.SharedMemory(name = name)
+            finally:
+                resource_tracker.register = register
+        arr = cls.__new__(cls)
+        arr._attach(shm, typecode, size, owner = False)
+        return arr
+
+    @property
+    def name(self):
+        """Return the name other processes use to attach."""
+        return self._shm.name
+
+    def detach(self):
+        """Stop using the shared block in this process."""
+        if self._shm is not None:
+            self.uninstrument()
+            self._data.release()
+            self._view.release()
+            self._shm.close()
+            self._shm = None
+            self._data = array(self._typecode)
+
+    def unlink(self):
+        """Free the shared block. Attached processes lose access to it."""
+        shm = self._shm
+        self.detach()
+        if shm is not None:
+            shm.unlink()
+
+    def close(self):
+        """Detach, and free the block if this process created it."""
+        if self._owner:
+            self.unlink()
+        else:
+            self.detach()
+
+    def __reduce_ex__(self, protocol):
+        return (type(self).attach, (self.name, self._typecode, len(self)))
+
+
+# Example Usage
+if __name__ == "__main__":
+
+    # Calls __init__
+    arr = Array([5,4,3])
+
+    # Calls __str__
+    print(arr)
+    
+    # Calls __getitem__ and __setitem__
+    temp = arr[0]
+    arr[0] = arr[-1]
+    arr[-1] = temp
+
+    # Calls __iter__
+    for element in arr:
+        print(element)
+
+    # Typed storage behaves the same way
+    typed = Array([5,4,3], typecode = 'i')
+    typed[0] = typed[-1]
+    print(typed, typed.typecode)
+
+    # Calls __getitem__ with a slice; writes through the view change arr
+    view = arr[1:]
+    view[0] = 0
+    print(view, arr)
+
+    # DynamicArray grows geometrically as elements are appended
+    grow = DynamicArray(typecode = 'q')
+    for i in range(10):
+        grow.append(i)
+    print(grow, len(grow), grow.capacity)
+    
+        
@@ -0,0 +1,266 @@
+# csstack.py
+# Marcus Gubanyi
+# 2025.02.19
+# Defines a simple stack class built with an array.
+# The purpose of this class is to work with a simple
+# stack that only pushes and pops and has an underlying
+# representation of a fixed-length array.
+#
+# Usage:
+# from cs2.csstack import Stack
+# s = Stack(max_size = 50)
+# s.push( ___ )
+# ___ = s.pop()
+# ___ = s.peek()
+# g = Stack(max_size = None)   # grows as needed, never overflows
+# d = WorkStealingDeque()      # owner push/pop, other threads steal
+
+from .csarray import Array, DynamicArray
+from array import array
+import threading
+
+class Stack():
+    """Stack object built with an array.
+
+    Supports pushing and popping elements. Errors if max is exceeded,
+    unless max_size is None, in which case the array doubles when full.
+    With shrink = True a growable stack also releases its spare room
+    when it falls to a quarter full, so memory follows the stack's size.
+    """
+
+    def __init__(self, data = None, max_size = 100, shrink = False):
+        
+        self._data = DynamicArray(capacity = max_size if max_size is not None else 16)
+        self._top = -1
+        self._max_size = max_size
+        self._shrink = shrink
+
+        if data is not None:
+            self.push_many(data)
+
+    def is_empty(self):
+        return self._top == -1
+
+    def is_full(self):
+        return self._max_size is not None and self._top + 1 == self._max_size
+
+    def __len__(self):
+        return self._top + 1
+
+    def peek(self):
+        """Return the top item without removing it."""
+        if self._top == -1:
+            raise IndexError("Stack Underflow Error!")
+        return self._data._data[self._top]
+
+    def push(self, item):
+        if self._top + 1 == self._max_size:
+            raise IndexError("Stack Overflow Error!")
+        self._top += 1
+        self._data.append(item)
+
+    def pop(self):
+        if self._top == -1:
+            raise IndexError("Stack Underflow Error!")
+        popped = self._data.pop()
+        self._top -= 1
+        if self._shrink:
+            self._shrink_if_sparse()
+        return popped
+
+    def push_many(self, items):
+        """Push every item in order; the last one ends up on top."""
+        items = list(items)
+        if self._max_size is not None and self._top + 1 + len(items) > self._max_size:
+            raise IndexError("Stack Overflow Error!")
+        self._data.extend(items)
+        self._top += len(items)
+
+    def pop_many(self, n):
+        """Pop n items and return them in the order pop() would."""
+        if n < 0:
+            raise ValueError("Cannot pop a negative number of items.")
+        if n > self._top + 1:
+            raise IndexError("Stack Underflow Error!")
+        popped = list(self._data[self._top - n + 1:self._top + 1])
+        popped.reverse()
+        self._top -= n
+        self._data.truncate(self._top + 1)
+        if self._shrink:
+            self._shrink_if_sparse()
+        return popped
+
+    def drain(self):
+        """Pop every item and return them in the order pop() would."""
+        return self.pop_many(self._top + 1)
+
+    def _shrink_if_sparse(self):
+        if self._max_size is None and self._data.capacity > 16 \
+                and self._top + 1 <= self._data.capacity // 4:
+            self._data.shrink_to_fit()
+
+class IntPairStack():
+    """Stack of (low, high) int pairs stored as two parallel typed arrays.
+
+    Used for the ranges still waiting to be sorted in the iterative quick
+    sorts. No object is kept per entry, so millions of pushes create no
+    garbage. The arrays double when full, like Stack(max_size = None).
+    """
+
+    def __init__(self, capacity = 64):
+        self._lows = array('q', [0]) * max(1, capacity)
+        self._highs = array('q', [0]) * max(1, capacity)
+        self._top = -1
+
+    def is_empty(self):
+        return self._top == -1
+
+    def __len__(self):
+        return self._top + 1
+
+    def push(self, low, high):
+        top = self._top + 1
+        if top == len(self._lows):
+            self._lows.extend(self._lows)
+            self._highs.extend(self._highs)
+        self._lows[top] = low
+        self._highs[top] = high
+        self._top = top
+
+    def pop(self):
+        """Remove the top pair and return it as (low, high)."""
+        top = self._top
+        if top == -1:
+            raise IndexError("Stack Underflow Error!")
+        self._top = top - 1
+        return self._lows[top], self._highs[top]
+
+    def peek(self):
+        """Return the top pair as (low, high) without removing it."""
+        if self._top == -1:
+            raise IndexError("Stack Underflow Error!")
+        return self._lows[self._top], self._highs[self._top]
+
+class WorkStealingDeque():
+    """Thread-safe deque for sharing work between threads.
+
+    The owning thread uses it like a Stack, pushing and popping at the
+    top. Idle threads steal the oldest item from the bottom, which for
+    divide-and-conquer work is usually the largest piece left.
+
+    The items live in a circular Array that doubles when full. Every
+    operation holds one lock, so each push, pop and steal is atomic.
+    pop() and steal() return None when the deque is empty instead of
+    raising, because another thread can empty it between is_empty()
+    and the call. Do not push None.
+    """
+
+    def __init__(self, capacity = 64):
+        self._data = Array(size = max(1, capacity), default = None)
+        self._bottom = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def is_empty(self):
+        return self._size == 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, item):
+        """Owner only: add item at the top."""
+        with self._lock:
+            if self._size == len(self._data):
+                self._grow()
+            self._data[(self._bottom + self._size) % len(self._data)] = item
+            self._size += 1
+
+    def pop(self):
+        """Owner only: remove and return the newest item, or None."""
+        with self._lock:
+            if self._size == 0:
+                return None
+            self._size -= 1
+            i = (self._bottom + self._size) % len(self._data)
+            item = self._data[i]
+            self._data[i] = None
+            return item
+
+    def steal(self):
+        """Any thread: remove and return the oldest item, or None."""
+        with self._lock:
+            if self._size == 0:
+                return None
+            item = self._data[self._bottom]
+            self._data[self._bottom] = None
+            self._bottom = (self._bottom + 1) % len(self._data)
+            self._size -= 1
+            return item
+
+    def _grow(self):
+        old = self._data
+        self._data = Array(size = 2 * len(old), default = None)
+        for k in range(self._size):
+            self._data[k] = old[(self._bottom + k) % len(old)]
+        self._bottom = 0
+
+
+def stress_test_work_stealing(items = 100000, thieves = 4):
+    """Check that every pushed item is taken exactly once.
+
+    The calling thread pushes items and pops every third one while the
+    thieves keep stealing. Returns how many items each thread took, with
+    the owner last.
+    """
+    deque = WorkStealingDeque(capacity = 4)
+    taken = [[] for _ in range(thieves + 1)]
+    done = threading.Event()
+
+    def thief(out):
+        while not done.is_set() or not deque.is_empty():
+            item = deque.steal()
+            if item is not None:
+                out.append(item)
+
+    workers = [threading.Thread(target = thief, args = (taken[k],)) for k in range(thieves)]
+    for worker in workers:
+        worker.start()
+
+    for i in range(items):
+        deque.push(i)
+        if i % 3 == 0:
+            item = deque.pop()
+            if item is not None:
+                taken[-1].append(item)
+    done.set()
+    for worker in workers:
+        worker.join()
+
+    every_item = sorted(item for out in taken for item in out)
+    if every_item != list(range(items)):
+        raise AssertionError("WorkStealingDeque lost or duplicated items")
+    return [len(out) for out in taken]
+
+# Example application of Stack class
+def valid_brackets(string):
+    stack = Stack()
+    for c in string:
+        if c in "([{":
+            stack.push(c)
+        elif stack.is_empty():
+            return False
+        else:
+            bracket = stack.pop()
+            if not (bracket == '(' and c == ')' or
+                    bracket == '[' and c == ']' or
+                    bracket == '{' and c == '}'):
+                return False
+
+    return stack.is_empty()
+        
+if __name__ == "__main__":
+    test_strings = ["()", "[[[]]]{}", "([(){}])[]", "(]", "[[[]]", "(([[])])"]
+    for s in test_strings:
+        print(f"{s} valid? {valid_brackets(s)}")
+
+    print(f"Items taken per thread: {stress_test_work_stealing()}")
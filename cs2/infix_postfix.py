@@ -1,4 +1,4 @@
-from csstack import Stack
+from .csstack import Stack
 import random
 import string
 
@@ -25,16 +25,15 @@ class InfixPostfix:
                         raise ValueError(f"Unbalanced parentheses in expression: {infix}")
                     popped = stack.pop()
             else:  # Handle operators
-                while (not stack.is_empty() and
-                    stack._data[stack._top] != "(" and
-                    (precedence[stack._data[stack._top]] > precedence[token] or
-                        (precedence[stack._data[stack._top]] == precedence[token] and token != "^"))):
-                    popped = stack.pop()
-                    postfix.append(popped)
+                while not stack.is_empty():
+                    top = stack.peek()
+                    if top == "(" or not (precedence[top] > precedence[token] or
+                            (precedence[top] == precedence[token] and token != "^")):
+                        break
+                    postfix.append(stack.pop())
                 stack.push(token)
 
-        while not stack.is_empty():
-            popped = stack.pop()
+        for popped in stack.drain():
             if popped == "(":
                 raise ValueError(f"Unbalanced parentheses in expression: {infix}")
             postfix.append(popped)
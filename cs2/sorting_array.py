@@ -0,0 +1,1790 @@
+"""
+sorting_array.py
+Brodie Rogers <brodie.rogers@students.cune.edu
+1/27/25
+
+This module implements the sorting algorithms from the sorting projects
+(insertion sort, shell sort, heap sort and the quick sort variants) on a
+custom Array class, along with functions to benchmark them with different
+input sizes and data arrangements.
+
+The benchmark dependencies (tqdm, csv) are imported only when a benchmark
+runs, so importing this module for sorting stays fast.
+"""
+
+from .csarray import Array, SharedArray
+from .csstack import IntPairStack, Stack
+from array import array
+from bisect import bisect_left, bisect_right
+import time
+
+
+class SortingArray(Array):
+    """
+    SortingArray object with fixed size and sorting behaviors.
+
+    This class extends the Array class to add sorting capabilities. Every
+    sort works in place on this array, or on any writable indexed buffer
+    passed as arr.
+    """
+
+    def insertion_sort(self, arr=None, binary=False):
+        """
+        Sorting array object with fixed sizes and sorting behavior.
+        arr can be any writable indexed buffer to sort in place instead.
+        binary=True uses binary_insertion_sort.
+        """
+        arr = self._data if arr is None else arr
+        if binary:
+            self.binary_insertion_sort(arr, 0, 1, len(arr))
+            return
+        for i in range(1, len(arr)):
+            # Insert arr[i] into sorted portion of arr[0:i]
+            temp = arr[i]
+            j = i - 1
+            # Loop through the already sorted arr along with the 1 added index
+            while j >= 0 and arr[j] > temp:
+                # Preform the swap and decrease j
+                arr[j + 1] = arr[j]
+                j -= 1
+            # Insert the number we are sorting into the correct index
+            arr[j + 1] = temp
+
+    def shell_sort(self, arr=None):
+        """
+        Sort elements using the Shell Sort algorithm.
+
+        Shell Sort works by comparing elements separated by a gap.
+        The gap starts large and progressively reduces until it reaches 1,
+        effectively becoming an insertion sort. This implementation uses
+        Knuth's sequence for gap calculation.
+
+        Time Complexity:
+            - Best Case: O(n log n)
+            - Average Case: O(n^1.5)
+            - Worst Case: O(n^2)
+
+        Space Complexity: O(1) as it sorts in-place
+
+        Args:
+            arr: Optional writable indexed buffer (list, array.array,
+                 memoryview, NumPy array, Array) to sort in place instead
+                 of this array
+        """
+        arr = self._data if arr is None else arr
+
+        gap = self.calc_init_gap(arr)
+
+        while gap > 0:
+            for i in range(gap, len(arr)):
+                temp = arr[i]
+                j = i - gap
+
+                while j >= 0 and arr[j] > temp:
+                    arr[j + gap] = arr[j]
+                    j = j - gap
+
+                arr[j + gap] = temp
+
+            gap = (gap - 1) // 3
+
+    def calc_init_gap(self, arr):
+        """
+        Calculate the initial gap size using Knuth's sequence.
+
+        The sequence follows the formula: (3^k - 1) / 2
+        where k is the number of iterations. The sequence generates
+        gap sizes: 1, 4, 13, 40, 121, ...
+
+        Args:
+            arr: The array for which to calculate the initial gap
+
+        Returns:
+            int: The largest gap size less than the array length
+        """
+        len_arr = len(arr)
+        start = 1
+
+        while start < len_arr:
+            start *= 3
+            start += 1
+        start = (start - 1) // 3
+
+        return start
+
+    def heap_sort(self, arr=None, bottom_up=False, arity=2):
+        # arr can be any writable indexed buffer; defaults to this array
+        # arity > 2 sorts with a d-ary heap, which always sifts bottom-up
+        arr = self._data if arr is None else arr
+        n = len(arr)
+        if arity < 2:
+            raise ValueError("A heap needs an arity of at least 2.")
+        if bottom_up or arity != 2:
+            self.bottom_up_heap_sort(arr, arity)
+            return
+
+        for i in range(n - 1, -1, -1):
+            self.heapify(arr, i, n)
+
+        # assume arr is max heap after heapifying it
+        j = n - 1
+        while j > 0:
+            temp = arr[0]
+            arr[0] = arr[j]
+            arr[j] = temp
+            self.heapify(arr, 0, j)
+            j -= 1
+
+    def heapify(self, arr, i, j):
+        while True:
+            left = 2 * i + 1
+            right = 2 * i + 2
+            if right < j and arr[right] > arr[left] and arr[right] > arr[i]:
+                arr[i], arr[right] = arr[right], arr[i]
+                i = right
+            elif left < j and arr[left] > arr[i]:
+                arr[i], arr[left] = arr[left], arr[i]
+                i = left
+            else:
+                break
+
+    def bottom_up_heap_sort(self, arr, arity=2):
+        """
+        Heap sort with Floyd's heap construction and Wegener's bottom-up
+        sift-down.
+
+        The heap is built from the last parent ((n - 2) // arity) up,
+        skipping the leaves. Each sift then walks a hole from the root down
+        to a leaf, taking the largest child at each level, and sifts the
+        displaced value back up from there. The value being placed usually
+        belongs near the bottom, so a binary heap takes about half the
+        comparisons of heapify, and elements are moved into the hole
+        instead of swapped.
+
+        With arity d the children of i are the contiguous d*i+1 .. d*i+d,
+        so the tree is log_d(n) levels deep (10 instead of 20 at 10^6 for
+        d = 4) and each level reads neighbouring elements.
+        """
+        if arity < 2:
+            raise ValueError("A heap needs an arity of at least 2.")
+        n = len(arr)
+        if arity == 2:
+            sift = self.bottom_up_heapify
+        else:
+            sift = lambda arr, i, j, value: self.d_ary_heapify(arr, i, j, value, arity)
+
+        for i in range((n - 2) // arity, -1, -1):
+            sift(arr, i, n, arr[i])
+
+        for j in range(n - 1, 0, -1):
+            value = arr[j]
+            arr[j] = arr[0]
+            sift(arr, 0, j, value)
+
+    def bottom_up_heapify(self, arr, i, j, value):
+        """
+        Place value in the heap arr[i:j] whose root i is treated as empty.
+        """
+        start = i
+        child = 2 * i + 1
+        while child < j:
+            if child + 1 < j and arr[child + 1] > arr[child]:
+                child += 1
+            arr[i] = arr[child]
+            i = child
+            child = 2 * i + 1
+
+        while i > start:
+            parent = (i - 1) // 2
+            if not value > arr[parent]:
+                break
+            arr[i] = arr[parent]
+            i = parent
+        arr[i] = value
+
+    def d_ary_heapify(self, arr, i, j, value, arity):
+        """
+        bottom_up_heapify for a heap where i has the children
+        arity*i+1 .. arity*i+arity. Each child is read once while looking
+        for the largest.
+        """
+        start = i
+        child = arity * i + 1
+        while child < j:
+            largest = arr[child]
+            for k in range(child + 1, min(child + arity, j)):
+                candidate = arr[k]
+                if candidate > largest:
+                    largest = candidate
+                    child = k
+            arr[i] = largest
+            i = child
+            child = arity * i + 1
+
+        while i > start:
+            parent = (i - 1) // arity
+            if not value > arr[parent]:
+                break
+            arr[i] = arr[parent]
+            i = parent
+        arr[i] = value
+
+    def recur_quick_sort(self, arr=None, low=0, high=None):
+        arr = self._data if arr is None else arr
+        if high is None:
+            high = len(arr) - 1
+        if low >= high:
+            return 
+        else:
+            mid = self.partition(arr, low, high)
+            self.recur_quick_sort(arr, low, mid-1)
+            self.recur_quick_sort(arr, mid+1, high)
+
+    def itter_quick_sort(self, arr=None):
+        arr = self._data if arr is None else arr
+        stack = IntPairStack()
+        stack.push(0, len(arr) - 1)
+
+        while not stack.is_empty():
+            low, high = stack.pop()
+            pivot = self.partition(arr, low, high)
+
+            if low < pivot - 1:
+                stack.push(low, pivot - 1)
+            if pivot + 1 < high:
+                stack.push(pivot + 1, high)
+
+    def itter_insert_quick_sort(self, arr=None):
+        arr = self._data if arr is None else arr
+        stack = IntPairStack()
+        stack.push(0, len(arr) - 1)
+
+        while not stack.is_empty():
+            low, high = stack.pop()
+            # Use insertion sort for small partitions
+            if high - low < 1000:  # Much smaller threshold value
+                # Apply binary insertion sort only to this partition
+                self.insertion_sort_partition(arr, low, high, binary=True)
+                continue
+
+            pivot = self.partition(arr, low, high)
+
+            if low < pivot - 1:
+                stack.push(low, pivot - 1)
+            if pivot + 1 < high:
+                stack.push(pivot + 1, high)
+
+    def intro_sort(self, arr=None):
+        """
+        Sort elements using introsort, a quick sort that cannot go quadratic.
+
+        Quick sort with median-of-three pivots does the work. Once the
+        partitions have gone 2 * log2(n) levels deep the remaining range
+        is finished with heap sort, and ranges of 16 or fewer elements
+        are finished with insertion sort. Only the smaller side of each
+        partition is recursed on, so the call stack stays O(log n).
+
+        Time Complexity: O(n log n) in every case
+        Space Complexity: O(log n)
+        """
+        arr = self._data if arr is None else arr
+        n = len(arr)
+        if n > 1:
+            self.intro_sort_partition(arr, 0, n - 1, 2 * (n.bit_length() - 1))
+
+    def intro_sort_partition(self, arr, low, high, depth):
+        """
+        Sort arr[low..high] with introsort, allowing depth more partitions.
+        """
+        while high - low >= 16:
+            if depth == 0:
+                # Too many bad pivots: heap sort this range in place
+                self.heap_sort_partition(arr, low, high)
+                return
+            depth -= 1
+
+            self.median_of_three(arr, low, high)
+            mid = self.balanced_partition(arr, low, high)
+
+            # Recurse on the smaller side, loop on the larger one
+            if mid - low < high - mid:
+                self.intro_sort_partition(arr, low, mid - 1, depth)
+                low = mid + 1
+            else:
+                self.intro_sort_partition(arr, mid + 1, high, depth)
+                high = mid - 1
+
+        self.insertion_sort_partition(arr, low, high)
+
+    def heap_sort_partition(self, arr, low, high):
+        """
+        Heap sort arr[low..high] in place, with the heap rooted at low.
+
+        Works like bottom_up_heap_sort with every index offset by low, so
+        the elements are read straight from arr.
+        """
+        n = high - low + 1
+        for i in range(n // 2 - 1, -1, -1):
+            self.heapify_partition(arr, low, i, n, arr[low + i])
+
+        for j in range(n - 1, 0, -1):
+            value = arr[low + j]
+            arr[low + j] = arr[low]
+            self.heapify_partition(arr, low, 0, j, value)
+
+    def heapify_partition(self, arr, low, i, j, value):
+        """
+        bottom_up_heapify for the heap arr[low..low+j-1], with i and j
+        counted from low.
+        """
+        start = i
+        child = 2 * i + 1
+        while child < j:
+            if child + 1 < j and arr[low + child + 1] > arr[low + child]:
+                child += 1
+            arr[low + i] = arr[low + child]
+            i = child
+            child = 2 * i + 1
+
+        while i > start:
+            parent = (i - 1) // 2
+            if not value > arr[low + parent]:
+                break
+            arr[low + i] = arr[low + parent]
+            i = parent
+        arr[low + i] = value
+
+    def dual_pivot_quick_sort(self, arr=None):
+        """
+        Sort elements using Yaroslavskiy's dual-pivot quick sort.
+
+        Two pivots p <= q split each range into three parts (< p, between
+        p and q, > q), so the recursion is shallower and fewer elements
+        are moved per level than with a single pivot. When the middle part
+        takes up more than two thirds of the range, the keys equal to p
+        or q are moved to its ends and left out, as in the JDK's version,
+        so arrays with few distinct values stay O(n log n). Ranges shorter
+        than 27 elements are finished with insertion sort.
+        """
+        arr = self._data if arr is None else arr
+        stack = IntPairStack()
+        stack.push(0, len(arr) - 1)
+
+        while not stack.is_empty():
+            low, high = stack.pop()
+            if high - low < 27:
+                self.insertion_sort_partition(arr, low, high)
+                continue
+
+            lt, gt = self.dual_pivot_partition(arr, low, high)
+
+            if low < lt - 1:
+                stack.push(low, lt - 1)
+            if gt + 1 < high:
+                stack.push(gt + 1, high)
+            # With equal pivots the middle part is all equal keys
+            if arr[lt] < arr[gt] and lt + 1 < gt - 1:
+                middle_low, middle_high = lt + 1, gt - 1
+                if 3 * (gt - lt) > 2 * (high - low):
+                    middle_low, middle_high = self.dual_pivot_squeeze(arr, middle_low, middle_high)
+                if middle_low < middle_high:
+                    stack.push(middle_low, middle_high)
+
+    def dual_pivot_partition(self, arr, low, high):
+        """
+        Partition arr[low..high] around two pivots taken from a third and
+        two thirds of the way through the range.
+
+        Returns (lt, gt), the final indices of the pivots p and q, so that
+        arr[low..lt-1] < p <= arr[lt+1..gt-1] <= q < arr[gt+1..high].
+        """
+        third = (high - low) // 3
+        arr[low], arr[low + third] = arr[low + third], arr[low]
+        arr[high], arr[high - third] = arr[high - third], arr[high]
+        if arr[low] > arr[high]:
+            arr[low], arr[high] = arr[high], arr[low]
+        p = arr[low]
+        q = arr[high]
+
+        lt = low + 1
+        gt = high - 1
+        k = lt
+        while k <= gt:
+            value = arr[k]
+            if value < p:
+                arr[k] = arr[lt]
+                arr[lt] = value
+                lt += 1
+            elif value > q:
+                while arr[gt] > q and k < gt:
+                    gt -= 1
+                arr[k] = arr[gt]
+                arr[gt] = value
+                gt -= 1
+                value = arr[k]
+                if value < p:
+                    arr[k] = arr[lt]
+                    arr[lt] = value
+                    lt += 1
+            k += 1
+
+        # Move the pivots into their final places
+        lt -= 1
+        gt += 1
+        arr[low] = arr[lt]
+        arr[lt] = p
+        arr[high] = arr[gt]
+        arr[gt] = q
+
+        return lt, gt
+
+    def dual_pivot_squeeze(self, arr, low, high):
+        """
+        Move the keys equal to the pivots to the ends of the middle part
+        arr[low..high], whose pivots p and q sit at low - 1 and high + 1.
+
+        Returns the bounds of what is left strictly between p and q.
+        """
+        p = arr[low - 1]
+        q = arr[high + 1]
+        while low <= high and arr[low] == p:
+            low += 1
+        while low <= high and arr[high] == q:
+            high -= 1
+
+        k = low
+        while k <= high:
+            value = arr[k]
+            if value == p:
+                arr[k] = arr[low]
+                arr[low] = value
+                low += 1
+            elif value == q:
+                while arr[high] == q and k < high:
+                    high -= 1
+                arr[k] = arr[high]
+                arr[high] = value
+                high -= 1
+                value = arr[k]
+                if value == p:
+                    arr[k] = arr[low]
+                    arr[low] = value
+                    low += 1
+            k += 1
+
+        return low, high
+
+    def parallel_quick_sort(self, workers=None, arr=None):
+        """
+        Sort elements with quick sort spread over a pool of processes.
+
+        The elements are copied into a SharedArray. The parent process
+        partitions the largest remaining range (three-way, ninther pivot)
+        until there are about four ranges per worker, then the workers
+        attach to the shared buffer and each sorts its ranges in place
+        with three_way_quick_sort. The ranges left by three-way partitions
+        hold few distinct keys, which two-way partitioning handles badly.
+        The result is copied back at the end.
+
+        Inputs under 100000 elements, a single worker, or values that
+        copy_to_shared cannot store exactly are sorted serially with
+        itter_insert_quick_sort.
+
+        Args:
+            workers (int): Number of processes, defaults to the CPU count
+            arr: Optional list or typed buffer to sort instead of this array
+        """
+        import os
+        from multiprocessing import Pool
+
+        arr = self._data if arr is None else arr
+        workers = workers or os.cpu_count() or 1
+        n = len(arr)
+        shared = None if workers < 2 or n < 100000 else self.copy_to_shared(arr)
+        if shared is None:
+            self.itter_insert_quick_sort(arr)
+            return
+
+        try:
+            # Split the top levels here so every worker has a range to sort
+            data = shared._data
+            ranges = [(0, n - 1)]
+            while ranges and len(ranges) < 4 * workers:
+                ranges.sort(key=lambda bounds: bounds[1] - bounds[0])
+                low, high = ranges.pop()
+                if high - low < 1000:
+                    ranges.append((low, high))
+                    break
+                self.ninther(data, low, high)
+                lt, gt = self.three_way_partition(data, low, high)
+                for bounds in ((low, lt - 1), (gt + 1, high)):
+                    if bounds[0] < bounds[1]:
+                        ranges.append(bounds)
+
+            with Pool(workers) as pool:
+                pool.map(_sort_shared_range, [(shared, low, high) for low, high in ranges])
+
+            self.copy_from_shared(shared, arr)
+        finally:
+            shared.close()
+
+    def sample_sort(self, workers=None, oversample=32, arr=None):
+        """
+        Sort elements with a parallel sample sort.
+
+        A random sample of workers * oversample elements is sorted and
+        every oversample-th element becomes a splitter. Each element's
+        bucket is found with bisect in one C-level pass into a compact
+        array of bucket numbers, and counting them gives every bucket's
+        start. A second pass then places each element straight from arr
+        at its bucket's next free slot in a SharedArray, so the data
+        moves only once. Worker processes sort the buckets in place with
+        three_way_quick_sort, and because the buckets are already in
+        order the sorted buffer is the result.
+
+        Inputs under 100000 elements, a single worker, or values that
+        shared_typecode cannot store exactly are sorted serially with
+        three_way_quick_sort.
+
+        Args:
+            workers (int): Number of processes, defaults to the CPU count
+            oversample (int): Sample elements drawn per bucket
+            arr: Optional list or typed buffer to sort instead of this array
+        """
+        import os
+        import random
+        from collections import Counter
+        from functools import partial
+        from multiprocessing import Pool
+
+        arr = self._data if arr is None else arr
+        workers = workers or os.cpu_count() or 1
+        n = len(arr)
+        typecode = None if workers < 2 or n < 100000 else self.shared_typecode(arr)
+        if typecode is None:
+            self.three_way_quick_sort(arr)
+            return
+
+        shared = SharedArray(size=n, typecode=typecode)
+        try:
+            data = shared._data
+            sample = sorted(arr[i] for i in random.sample(range(n), min(n, workers * oversample)))
+            # Duplicate splitters would only make empty buckets
+            splitters = sorted(set(sample[oversample::oversample]))
+
+            buckets = array('L', map(partial(bisect_right, splitters), arr))
+            sizes = Counter(buckets)
+            starts = []
+            ranges = []
+            start = 0
+            for bucket in range(len(splitters) + 1):
+                starts.append(start)
+                if sizes[bucket] > 1:
+                    ranges.append((start, start + sizes[bucket] - 1))
+                start += sizes[bucket]
+
+            for value, bucket in zip(arr, buckets):
+                data[starts[bucket]] = value
+                starts[bucket] += 1
+
+            with Pool(workers) as pool:
+                pool.map(_sort_shared_range, [(shared, low, high) for low, high in ranges])
+
+            self.copy_from_shared(shared, arr)
+        finally:
+            shared.close()
+
+    def copy_to_shared(self, arr):
+        """
+        Return a new SharedArray holding a copy of arr, or None when its
+        values cannot be stored exactly in one typecode.
+
+        Lists of ints that fit in 64 bits become 'q' and lists of floats
+        become 'd'. Anything else, such as mixed ints and floats, big ints
+        or strings, returns None, so copying back never changes a value's
+        type. Typed buffers keep their own format.
+        """
+        typecode = self.shared_typecode(arr)
+        if typecode is None:
+            return None
+        if isinstance(arr, list):
+            return SharedArray(arr, typecode=typecode)
+        with memoryview(arr) as source:
+            shared = SharedArray(size=len(source), typecode=typecode)
+            shared._data[:] = source
+        return shared
+
+    def shared_typecode(self, arr):
+        """
+        Return the typecode copy_to_shared would store arr with, or None.
+        """
+        from array import typecodes
+
+        if isinstance(arr, list):
+            kinds = set(map(type, arr))
+            if kinds == {float}:
+                return 'd'
+            if kinds == {int} and -2**63 <= min(arr) and max(arr) < 2**63:
+                return 'q'
+            return None
+
+        try:
+            with memoryview(arr) as source:
+                return source.format if source.format in typecodes else None
+        except TypeError:
+            return None
+
+    def copy_from_shared(self, shared, arr):
+        """
+        Copy the elements of shared back over arr.
+        """
+        if isinstance(arr, list):
+            arr[:] = shared._data.tolist()
+        else:
+            with memoryview(arr) as target:
+                target[:] = shared._data
+
+    def three_way_quick_sort(self, arr=None):
+        """
+        Sort elements using quick sort with three-way partitioning.
+
+        Each partition groups the elements equal to the pivot in the
+        middle and never looks at them again, so arrays with few distinct
+        values (like the randint(0, 100) benchmarks) take about
+        O(n * distinct values) instead of O(n log n) work.
+        """
+        arr = self._data if arr is None else arr
+        stack = IntPairStack()
+        stack.push(0, len(arr) - 1)
+
+        while not stack.is_empty():
+            low, high = stack.pop()
+            if high - low < 16:
+                self.insertion_sort_partition(arr, low, high)
+                continue
+
+            self.ninther(arr, low, high)
+            lt, gt = self.three_way_partition(arr, low, high)
+
+            if low < lt - 1:
+                stack.push(low, lt - 1)
+            if gt + 1 < high:
+                stack.push(gt + 1, high)
+
+    def three_way_partition(self, arr, low, high):
+        """
+        Dutch national flag partition of arr[low..high] around arr[low].
+
+        Returns (lt, gt) such that arr[low..lt-1] < pivot,
+        arr[lt..gt] == pivot and arr[gt+1..high] > pivot.
+        """
+        pivot = arr[low]
+        lt = low
+        i = low + 1
+        gt = high
+        while i <= gt:
+            value = arr[i]
+            if value < pivot:
+                arr[i] = arr[lt]
+                arr[lt] = value
+                lt += 1
+                i += 1
+            elif value > pivot:
+                arr[i] = arr[gt]
+                arr[gt] = value
+                gt -= 1
+            else:
+                i += 1
+
+        return lt, gt
+
+    def counting_sort(self, arr=None):
+        """
+        Sort integers by counting how often each value occurs.
+
+        Takes O(n + k) time and O(k) extra space for a key range of
+        k = max - min + 1, so it suits small ranges like the
+        randint(0, 100) benchmarks. When k is more than 4n + 256 the
+        counting would cost more than the sort, so the array is handed
+        to radix_sort instead.
+
+        Raises:
+            TypeError: If an element is not an int (bools and floats
+                       included, since counting would turn them into ints)
+        """
+        from collections import Counter
+
+        arr = self._data if arr is None else arr
+        if len(arr) < 2:
+            return
+        if set(map(type, arr)) != {int}:
+            raise TypeError("counting_sort only sorts ints")
+        counts = Counter(arr)
+        low = min(counts)
+        high = max(counts)
+        if high - low + 1 > 4 * len(arr) + 256:
+            self.radix_sort(arr)
+            return
+
+        result = []
+        for value in range(low, high + 1):
+            count = counts.get(value)
+            if count:
+                result.extend([value] * count)
+        self.write_back(arr, result)
+
+    def radix_sort(self, arr=None):
+        """
+        Sort ints or floats with an LSD radix sort, one byte per pass.
+
+        Every element gets a non-negative int key with the same order
+        (see radix_keys), and the keys are distributed into 256 buckets
+        per byte, lowest byte first. Each pass is stable, so after the
+        last one the elements are in order. Takes O(n * bytes) time with
+        no comparisons between elements.
+
+        Raises:
+            TypeError: If an element is not an int or float
+        """
+        from itertools import chain
+
+        arr = self._data if arr is None else arr
+        values = list(arr)
+        if len(values) < 2:
+            return
+        keys = self.radix_keys(values)
+
+        order = range(len(values))
+        for shift in range(0, max(keys).bit_length(), 8):
+            buckets = [[] for _ in range(256)]
+            for i in order:
+                buckets[keys[i] >> shift & 255].append(i)
+            order = list(chain.from_iterable(buckets))
+
+        self.write_back(arr, [values[i] for i in order])
+
+    def radix_keys(self, values):
+        """
+        Return a non-negative int key per value that sorts like the values.
+
+        Ints are shifted by the minimum. Only when that still needs more
+        than 8 bytes is each int replaced by its rank among the distinct
+        values (coordinate compression), because the sort that ranks them
+        would otherwise do the work the byte passes are there for.
+
+        Floats are mapped through their IEEE-754 bits: the sign bit is set
+        on positives and every bit is flipped on negatives, which makes the
+        unsigned bit patterns ordered like the floats. Ints mixed in with
+        floats take the same path, so each one must be exactly equal to a
+        double.
+
+        Raises:
+            TypeError: If a value is not an int or float, or an int mixed
+                       with floats cannot be stored exactly as a double
+        """
+        if all(type(value) is int for value in values):
+            low = min(values)
+            if (max(values) - low).bit_length() <= 64:
+                return [value - low for value in values]
+            rank = {value: i for i, value in enumerate(sorted(set(values)))}
+            return [rank[value] for value in values]
+
+        if not all(isinstance(value, (int, float)) for value in values):
+            raise TypeError("radix_sort only sorts ints and floats")
+        try:
+            exact = all(float(value) == value for value in values if type(value) is not float)
+        except OverflowError:
+            exact = False
+        if not exact:
+            raise TypeError("radix_sort cannot mix floats with ints too large for a double")
+        bits = array('Q')
+        bits.frombytes(array('d', values).tobytes())
+        sign = 1 << 63
+        return [key ^ 0xFFFFFFFFFFFFFFFF if key & sign else key | sign for key in bits]
+
+    def write_back(self, arr, values):
+        """
+        Overwrite arr with values, in one slice assignment when arr allows it.
+        """
+        if isinstance(arr, list):
+            arr[:] = values
+        elif isinstance(arr, array):
+            arr[:] = array(arr.typecode, values)
+        else:
+            for i, value in enumerate(values):
+                arr[i] = value
+
+    def string_quick_sort(self, arr=None):
+        """
+        Sort strings with Bentley-Sedgewick three-way string quicksort.
+
+        Each partition splits arr[low..high] on the character at depth d
+        into strings whose d-th character is less than, equal to or greater
+        than the pivot's. Only the equal group moves on to depth d + 1, so
+        a shared prefix is examined about once instead of on every
+        comparison. Strings that end before depth d have the empty string
+        as their character and sort first. When a whole range agrees on
+        its character, the depth jumps to the end of the range's common
+        prefix (the common prefix of its smallest and largest strings)
+        instead of stepping one character at a time. Small ranges finish
+        with insertion sort.
+        """
+        from os.path import commonprefix
+
+        arr = self._data if arr is None else arr
+        stack = Stack(max_size=None)
+        stack.push((0, len(arr) - 1, 0))
+
+        while not stack.is_empty():
+            low, high, d = stack.pop()
+            if high - low < 16:
+                self.insertion_sort_partition(arr, low, high, binary=True)
+                continue
+
+            lt, gt, pivot = self.string_partition(arr, low, high, d)
+            if pivot and lt == low and gt == high:
+                strings = [arr[i] for i in range(low, high + 1)]
+                d = max(d, len(commonprefix([min(strings), max(strings)])) - 1)
+
+            if low < lt - 1:
+                stack.push((low, lt - 1, d))
+            if gt + 1 < high:
+                stack.push((gt + 1, high, d))
+            if pivot and lt < gt:
+                stack.push((lt, gt, d + 1))
+
+    def string_partition(self, arr, low, high, d):
+        """
+        Three-way partition of arr[low..high] on the character at depth d.
+
+        The pivot character is the median of the low, middle and high
+        strings' characters. Returns (lt, gt, pivot) like
+        three_way_partition, with pivot the one-character string (empty
+        past the end of the string).
+        """
+        def char_at(i):
+            return arr[i][d:d + 1]
+
+        mid = (low + high) // 2
+        a, b, c = char_at(low), char_at(mid), char_at(high)
+        pivot = max(min(a, b), min(max(a, b), c))
+
+        lt = low
+        i = low
+        gt = high
+        while i <= gt:
+            value = char_at(i)
+            if value < pivot:
+                arr[i], arr[lt] = arr[lt], arr[i]
+                lt += 1
+                i += 1
+            elif value > pivot:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                gt -= 1
+            else:
+                i += 1
+
+        return lt, gt, pivot
+
+    def natural_merge_sort(self, arr=None):
+        """
+        Sort elements with an adaptive natural merge sort, like Timsort.
+
+        The array is scanned for runs that are already ascending, or
+        strictly descending (these are reversed in place, which keeps the
+        sort stable). Runs shorter than min_run_length(n) are extended with
+        binary insertion sort. Runs go on a stack that is merged whenever
+        the top lengths stop shrinking like the Fibonacci numbers, which
+        keeps the merges balanced. Merges gallop once one side keeps
+        winning, so already sorted, reversed and nearly sorted arrays take
+        O(n) time.
+        """
+        arr = self._data if arr is None else arr
+        n = len(arr)
+        if n < 2:
+            return
+
+        min_run = self.min_run_length(n)
+        runs = []
+        low = 0
+        while low < n:
+            high = self.find_run(arr, low, n)
+            if high - low < min_run:
+                end = min(low + min_run, n)
+                self.binary_insertion_sort(arr, low, high, end)
+                high = end
+            runs.append((low, high))
+            self.merge_collapse(arr, runs)
+            low = high
+
+        while len(runs) > 1:
+            self.merge_at(arr, runs, len(runs) - 2)
+
+    def min_run_length(self, n):
+        """
+        Return the shortest run to build, between 32 and 64, chosen so
+        n / min_run is a power of two or just under one.
+        """
+        extra = 0
+        while n >= 64:
+            extra |= n & 1
+            n >>= 1
+        return n + extra
+
+    def find_run(self, arr, low, n):
+        """
+        Return the end (exclusive) of the run starting at low, reversing
+        it first if it is strictly descending.
+        """
+        high = low + 1
+        if high == n:
+            return high
+
+        if arr[high] < arr[low]:
+            while high < n and arr[high] < arr[high - 1]:
+                high += 1
+            i, j = low, high - 1
+            while i < j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+        else:
+            while high < n and not arr[high] < arr[high - 1]:
+                high += 1
+        return high
+
+    def binary_insertion_sort(self, arr, low, start, high):
+        """
+        Sort arr[low:high] given that arr[low:start] is already sorted,
+        finding each insertion point with a binary search.
+
+        This takes O(n log n) comparisons. On a list or array.array the
+        elements after the insertion point move up with one slice
+        assignment, which is a memmove in C. Other buffers, such as views
+        whose slices share storage, shift one element at a time.
+        """
+        block_shift = isinstance(arr, (list, array))
+        for i in range(start, high):
+            value = arr[i]
+            position = bisect_right(arr, value, low, i)
+            if position == i:
+                continue
+            if block_shift:
+                arr[position + 1:i + 1] = arr[position:i]
+            else:
+                for k in range(i, position, -1):
+                    arr[k] = arr[k - 1]
+            arr[position] = value
+
+    def merge_collapse(self, arr, runs):
+        """
+        Merge runs on top of the stack until every run is longer than the
+        two above it put together, and longer than the one above it.
+        """
+        while len(runs) > 1:
+            i = len(runs) - 2
+            length = [high - low for low, high in runs[-4:]]
+            if (len(runs) > 2 and length[-3] <= length[-2] + length[-1]) or \
+                    (len(runs) > 3 and length[-4] <= length[-3] + length[-2]):
+                if length[-3] < length[-1]:
+                    i -= 1
+            elif length[-2] > length[-1]:
+                break
+            self.merge_at(arr, runs, i)
+
+    def merge_at(self, arr, runs, i):
+        """
+        Merge runs i and i + 1 into one run.
+        """
+        low, mid = runs[i]
+        high = runs[i + 1][1]
+        self.gallop_merge(arr, low, mid, high)
+        runs[i] = (low, high)
+        del runs[i + 1]
+
+    def gallop_merge(self, arr, low, mid, high):
+        """
+        Merge the sorted runs arr[low:mid] and arr[mid:high].
+
+        Elements of the left run no greater than the right's first, and
+        elements of the right run no less than the left's last, are
+        already in place and skipped. The rest of the left run is copied
+        out and merged one element at a time until one side wins 7 times
+        in a row. Then it gallops, copying everything up to the other
+        side's next element in one block found with gallop_right and
+        gallop_left, until the blocks get short again.
+        """
+        low = self.gallop_right(arr, arr[mid], low, mid)
+        high = self.gallop_left(arr, arr[mid - 1], mid, high)
+        if low == mid or mid == high:
+            return
+
+        left = [arr[i] for i in range(low, mid)]
+        i, j, k = 0, mid, low
+        while i < len(left) and j < high:
+            left_wins = right_wins = 0
+            while i < len(left) and j < high:
+                if arr[j] < left[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    arr[k] = left[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+                k += 1
+                if left_wins >= 7 or right_wins >= 7:
+                    break
+
+            while i < len(left) and j < high:
+                end = self.gallop_right(left, arr[j], i, len(left))
+                copied = end - i
+                for value in left[i:end]:
+                    arr[k] = value
+                    k += 1
+                i = end
+                if i == len(left):
+                    break
+
+                end = self.gallop_left(arr, left[i], j, high)
+                copied = max(copied, end - j)
+                while j < end:
+                    arr[k] = arr[j]
+                    k += 1
+                    j += 1
+                if copied < 7:
+                    break
+
+        for value in left[i:]:
+            arr[k] = value
+            k += 1
+
+    def gallop_right(self, arr, key, low, high):
+        """
+        Return the index after the last element <= key in the sorted
+        arr[low:high]. Probes low, low + 1, low + 3, low + 7, ... before a
+        binary search, so it is fast when the answer is near low.
+        """
+        last = low
+        offset = 1
+        while low + offset - 1 < high and not key < arr[low + offset - 1]:
+            last = low + offset
+            offset *= 2
+        return bisect_right(arr, key, last, min(low + offset - 1, high))
+
+    def gallop_left(self, arr, key, low, high):
+        """
+        Return the index of the first element >= key in the sorted
+        arr[low:high], searching outwards from low like gallop_right.
+        """
+        last = low
+        offset = 1
+        while low + offset - 1 < high and arr[low + offset - 1] < key:
+            last = low + offset
+            offset *= 2
+        return bisect_left(arr, key, last, min(low + offset - 1, high))
+
+    def ninther(self, arr, low, high):
+        """
+        Move Tukey's ninther (the median of the medians of three groups of
+        three spread across arr[low..high]) to arr[low] for partitioning.
+        Unlike a plain median of three it still finds a central pivot in
+        the rotated runs that three-way partitioning leaves behind.
+        """
+        step = (high - low) // 8
+        mid = (low + high) // 2
+        first = self.median_index(arr, low, low + step, low + 2 * step)
+        middle = self.median_index(arr, mid - step, mid, mid + step)
+        last = self.median_index(arr, high - 2 * step, high - step, high)
+        median = self.median_index(arr, first, middle, last)
+        arr[low], arr[median] = arr[median], arr[low]
+
+    def median_index(self, arr, a, b, c):
+        """
+        Return whichever of the indices a, b and c holds the median value.
+        """
+        if arr[a] < arr[b]:
+            if arr[b] < arr[c]:
+                return b
+            return c if arr[a] < arr[c] else a
+        if arr[a] < arr[c]:
+            return a
+        return c if arr[b] < arr[c] else b
+
+    def median_of_three(self, arr, low, high):
+        """
+        Order the first, middle and last elements, then move the median to
+        arr[low], where partition takes its pivot from. Sorting all three
+        keeps already ordered and reversed inputs from splitting badly.
+        """
+        mid = (low + high) // 2
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+        if arr[high] < arr[mid]:
+            arr[mid], arr[high] = arr[high], arr[mid]
+            if arr[mid] < arr[low]:
+                arr[low], arr[mid] = arr[mid], arr[low]
+        arr[low], arr[mid] = arr[mid], arr[low]
+
+    def balanced_partition(self, arr, low, high):
+        """
+        Partition arr[low..high] around the pivot arr[low] and return the
+        pivot's final index, like partition. Both scans stop on elements
+        equal to the pivot, so runs of duplicate keys are split evenly
+        between the two sides instead of all landing on one.
+        """
+        pivot = arr[low]
+        i = low
+        j = high + 1
+        while True:
+            i += 1
+            while i < high and arr[i] < pivot:
+                i += 1
+            j -= 1
+            while arr[j] > pivot:
+                j -= 1
+            if i >= j:
+                break
+            arr[i], arr[j] = arr[j], arr[i]
+
+        arr[low], arr[j] = arr[j], arr[low]
+
+        return j
+
+    def partition(self, arr, low, high):
+        pivot = arr[low]
+        i = low + 1
+        j = high
+        while i <= j:
+            if arr[j] > pivot:
+                j -= 1
+            elif arr[i] <= pivot:
+                i += 1
+            else:
+                arr[i], arr[j] = arr[j], arr[i]
+                j -= 1
+                i += 1
+
+        arr[low], arr[j] = arr[j], arr[low]
+
+        return j
+
+    def insertion_sort_partition(self, arr, low, high, binary=False):
+        """
+        Sorting a specific partition of the array using insertion sort.
+        binary=True uses binary_insertion_sort.
+        """
+        if binary:
+            self.binary_insertion_sort(arr, low, low + 1, high + 1)
+            return
+        for i in range(low + 1, high + 1):
+            # Insert arr[i] into sorted portion
+            temp = arr[i]
+            j = i - 1
+            # Loop through the already sorted part of this partition
+            while j >= low and arr[j] > temp:
+                # Perform the swap and decrease j
+                arr[j + 1] = arr[j]
+                j -= 1
+            # Insert the number we are sorting into the correct index
+            arr[j + 1] = temp
+
+    @staticmethod
+    def save_data(t, data, prefix=None):
+        """
+        Save sorting performance data to CSV files.
+
+        Args:
+            t (str): Type of data being saved:
+                     'r' for random array data
+                     'a' for ascending array data
+                     'd' for descending array data
+            data (list): List of timing measurements to save
+            prefix (str): Optional algorithm name prepended to the file name
+
+        Raises:
+            Exception: If file operations fail
+        """
+        import csv
+
+        if t == "r":
+            file_name = "random.csv"
+        elif t == "a":
+            file_name = "asceding.csv"
+        elif t == "d":
+            file_name = "descending.csv"
+        else:
+            print("please give 'r', 'a', or 'd' for the t value")
+        if prefix is not None:
+            file_name = f"{prefix}-{file_name}"
+
+        try:
+            with open(file_name, "a") as file:
+                writer = csv.writer(file)
+                writer.writerow(data)
+            file.close()
+        except Exception as e:
+            print(f"Could save data. {e}")
+
+    @staticmethod
+    def test_heap_sort():
+        """
+        Benchmark the Heap Sort implementation with various input sizes.
+
+        Tests the algorithm with three different array arrangements:
+            1. Random order arrays
+            2. Ascending order arrays
+            3. Descending order arrays
+
+        For each arrangement, tests array sizes:
+            [10, 100, 1000, 10000, 20000, 100000, 1000000]
+
+        Performs 100 epochs of testing and saves timing data to CSV files.
+        Each timing measurement is rounded to 4 decimal places.
+        """
+        from tqdm import tqdm
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        time_data = []
+        epochs = 100
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.random(s, 0, 100)
+
+                start = time.time()
+                arr.heap_sort()
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data, "heap")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.ascending(s)
+
+                start = time.time()
+                arr.heap_sort()
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data, "heap")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.descending(s)
+
+                start = time.time()
+                arr.heap_sort()
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data, "heap")
+
+    @staticmethod
+    def test_itter_quick_sort():
+        """
+        Benchmark the Itterative Quick Sort implementation with various input sizes.
+
+        Tests the algorithm with three different array arrangements:
+            1. Random order arrays
+            2. Ascending order arrays
+            3. Descending order arrays
+
+        For each arrangement, tests array sizes:
+            [10, 100, 1000, 10000, 20000, 100000, 1000000]
+
+        Performs 100 epochs of testing and saves timing data to CSV files.
+        Each timing measurement is rounded to 4 decimal places.
+        """
+        from tqdm import tqdm
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        time_data = []
+        epochs = 10
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.random(s, 0, 100)
+
+                start = time.time()
+                arr.itter_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data, "itter-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.ascending(s)
+
+                start = time.time()
+                arr.itter_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data, "itter-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.descending(s)
+
+                start = time.time()
+                arr.itter_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data, "itter-quick")
+
+    @staticmethod
+    def test_itter_insert_quick_sort():
+        """
+        Benchmark the Itterative Insert Quick Sort implementation with various input sizes.
+
+        Tests the algorithm with three different array arrangements:
+            1. Random order arrays
+            2. Ascending order arrays
+            3. Descending order arrays
+
+        For each arrangement, tests array sizes:
+            [10, 100, 1000, 10000, 20000, 100000, 1000000]
+
+        Performs 100 epochs of testing and saves timing data to CSV files.
+        Each timing measurement is rounded to 4 decimal places.
+        """
+        from tqdm import tqdm
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        time_data = []
+        epochs = 10
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.random(s, 0, 100)
+
+                start = time.time()
+                arr.itter_insert_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data, "itter-insert-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.ascending(s)
+
+                start = time.time()
+                arr.itter_insert_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data, "itter-insert-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.descending(s)
+
+                start = time.time()
+                arr.itter_insert_quick_sort(arr._data)  # , 0, len(arr) - 1
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data, "itter-insert-quick")
+
+    @staticmethod
+    def test_recur_quick_sort():
+        """
+        Benchmark the Recursive Qucick Sort implementation with various input sizes.
+
+        Tests the algorithm with three different array arrangements:
+            1. Random order arrays
+            2. Ascending order arrays
+            3. Descending order arrays
+
+        For each arrangement, tests array sizes:
+            [10, 100, 1000, 10000, 20000, 100000, 1000000]
+
+        Performs 10 epochs of testing and saves timing data to CSV files.
+        Each timing measurement is rounded to 4 decimal places.
+        """
+        from tqdm import tqdm
+        import sys
+
+        # Sorted inputs recurse n levels deep
+        sys.setrecursionlimit(10**6)
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        time_data = []
+        epochs = 10
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.random(s, 0, 100)
+
+                start = time.time()
+                arr.recur_quick_sort(arr._data, 0, len(arr) - 1)  # , 0, len(arr) - 1
+                end = time.time()
+
+                print(f"Random {s} sorted in {end - start}")
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data, "recur-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.ascending(s)
+
+                start = time.time()
+                arr.recur_quick_sort(arr._data, 0, len(arr) - 1)  # , 0, len(arr) - 1
+                end = time.time()
+                print(f"Ascending {s} sorted in {end - start}")
+
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data, "recur-quick")
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.descending(s)
+
+                start = time.time()
+                arr.recur_quick_sort(arr._data, 0, len(arr) - 1)  
+                end = time.time()
+                print(f"Descending {s} sorted in {end - start}")
+
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data, "recur-quick")
+
+    @staticmethod
+    def benchmark_sort(sort, prefix, epochs=10):
+        """
+        Benchmark a sorting algorithm with various input sizes.
+
+        Times sort(arr) on random, ascending and descending arrays of sizes
+            [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        and appends the timings to the {prefix}-random, {prefix}-asceding
+        and {prefix}-descending CSV files, like the test_* functions above.
+
+        Args:
+            sort (callable): Sorts the SortingArray passed to it in place
+            prefix (str): Algorithm name used in the CSV file names
+            epochs (int): Number of rounds of testing
+        """
+        from tqdm import tqdm
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000, 1000000]
+        arrangements = {
+            "r": lambda s: SortingArray.random(s, 0, 100),
+            "a": SortingArray.ascending,
+            "d": SortingArray.descending,
+        }
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            for t, make in arrangements.items():
+                time_data = []
+                for s in sizes:
+                    arr = make(s)
+
+                    start = time.time()
+                    sort(arr)
+                    end = time.time()
+
+                    time_data.append(round(end - start, 4))
+                SortingArray.save_data(t, time_data, prefix)
+
+    @staticmethod
+    def test_bottom_up_heap_sort():
+        """
+        Benchmark the bottom-up Heap Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.heap_sort(bottom_up=True), "bottom-up-heap")
+
+    @staticmethod
+    def test_d_ary_heap_sort(arity=4):
+        """
+        Benchmark the d-ary Heap Sort implementation for 10 epochs.
+
+        Compare the {arity}-ary-heap CSV files against the heap and
+        bottom-up-heap ones for the binary versions.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.heap_sort(arity=arity), f"{arity}-ary-heap")
+
+    @staticmethod
+    def test_intro_sort():
+        """
+        Benchmark the Introsort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.intro_sort(), "intro")
+
+    @staticmethod
+    def test_three_way_quick_sort():
+        """
+        Benchmark the Three-Way Quick Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.three_way_quick_sort(), "three-way-quick")
+
+    @staticmethod
+    def test_dual_pivot_quick_sort():
+        """
+        Benchmark the Dual-Pivot Quick Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.dual_pivot_quick_sort(), "dual-pivot-quick")
+
+    @staticmethod
+    def test_counting_sort():
+        """
+        Benchmark the Counting Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.counting_sort(), "counting")
+
+    @staticmethod
+    def test_radix_sort():
+        """
+        Benchmark the LSD Radix Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.radix_sort(), "radix")
+
+    @staticmethod
+    def test_natural_merge_sort():
+        """
+        Benchmark the Natural Merge Sort implementation for 10 epochs.
+        """
+        SortingArray.benchmark_sort(lambda arr: arr.natural_merge_sort(), "natural-merge")
+
+    @staticmethod
+    def test_string_quick_sort(size=1000000):
+        """
+        Compare the string quicksort with three_way_quick_sort on strings.
+
+        Sorts size random expressions from InfixPostfix.generate_infix,
+        like the lines of test_cases.txt, and prints both times.
+        """
+        from .infix_postfix import InfixPostfix
+
+        lines = [InfixPostfix.generate_infix("large") for _ in range(size)]
+        for name in ("string_quick_sort", "three_way_quick_sort"):
+            arr = SortingArray(list(lines))
+
+            start = time.time()
+            getattr(arr, name)()
+            end = time.time()
+
+            print(f"{name} {size}: {round(end - start, 4)}s")
+
+    @staticmethod
+    def test_parallel_quick_sort(size=1000000, worker_counts=(2, 4, 8)):
+        """
+        Report the speedup of the Parallel Quick Sort over worker counts.
+
+        Sorts the same random array serially with three_way_quick_sort
+        (the kernel each worker runs) and then with each number of
+        workers, printing the times and the speedup over the serial sort.
+        """
+        data = SortingArray.random(size, 0, 100)
+
+        arr = SortingArray(list(data))
+        start = time.time()
+        arr.three_way_quick_sort()
+        serial_time = time.time() - start
+        print(f"serial: {round(serial_time, 4)}s")
+
+        for workers in worker_counts:
+            arr = SortingArray(list(data))
+
+            start = time.time()
+            arr.parallel_quick_sort(workers=workers)
+            end = time.time()
+
+            print(f"{workers} workers: {round(end - start, 4)}s, "
+                  f"speedup {round(serial_time / (end - start), 2)}x")
+
+    @staticmethod
+    def test_sample_sort(size=1000000, worker_counts=(2, 4, 8)):
+        """
+        Report the speedup of the Sample Sort over worker counts.
+
+        Sorts the same random array serially with three_way_quick_sort
+        (the kernel each worker runs) and then with each number of
+        workers, printing the times and the speedup over the serial sort.
+        """
+        data = SortingArray.random(size, 0, 10**9)
+
+        arr = SortingArray(list(data))
+        start = time.time()
+        arr.three_way_quick_sort()
+        serial_time = time.time() - start
+        print(f"serial: {round(serial_time, 4)}s")
+
+        for workers in worker_counts:
+            arr = SortingArray(list(data))
+
+            start = time.time()
+            arr.sample_sort(workers=workers)
+            end = time.time()
+
+            print(f"{workers} workers: {round(end - start, 4)}s, "
+                  f"speedup {round(serial_time / (end - start), 2)}x")
+
+    @staticmethod
+    def test_operation_counts(size=1000):
+        """
+        Report the work each sorting algorithm does, not just its time.
+
+        Runs every algorithm on random, ascending and descending arrays
+        of the given size with instrumentation turned on and prints the
+        number of element reads, writes, comparisons and swaps.
+        """
+        import sys
+
+        # recur_quick_sort recurses n levels deep on sorted inputs
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * size))
+
+        sorts = {
+            "heap": lambda arr: arr.heap_sort(),
+            "bottom-up-heap": lambda arr: arr.heap_sort(bottom_up=True),
+            "4-ary-heap": lambda arr: arr.heap_sort(arity=4),
+            "recur-quick": lambda arr: arr.recur_quick_sort(arr._data, 0, len(arr) - 1),
+            "itter-quick": lambda arr: arr.itter_quick_sort(arr._data),
+            "itter-insert-quick": lambda arr: arr.itter_insert_quick_sort(arr._data),
+            "intro": lambda arr: arr.intro_sort(),
+            "three-way-quick": lambda arr: arr.three_way_quick_sort(),
+            "dual-pivot-quick": lambda arr: arr.dual_pivot_quick_sort(),
+            "counting": lambda arr: arr.counting_sort(),
+            "radix": lambda arr: arr.radix_sort(),
+            "natural-merge": lambda arr: arr.natural_merge_sort(),
+        }
+        arrangements = {
+            "Random": lambda: SortingArray.random(size, 0, 100),
+            "Ascending": lambda: SortingArray.ascending(size),
+            "Descending": lambda: SortingArray.descending(size),
+        }
+
+        for name, sort in sorts.items():
+            for arrangement, make in arrangements.items():
+                arr = make()
+                counts = arr.instrument()
+                sort(arr)
+                arr.uninstrument()
+                print(f"{name} {arrangement} {size}: {counts}")
+
+    @staticmethod
+    def test_shell_sort():
+        """
+        Benchmark the Shell Sort implementation with various input sizes.
+
+        Tests the algorithm with three different array arrangements:
+            1. Random order arrays
+            2. Ascending order arrays
+            3. Descending order arrays
+
+        For each arrangement, tests array sizes:
+            [10, 100, 1000, 10000, 20000, 100000]
+
+        Performs 100 epochs of testing and saves timing data to CSV files.
+        Each timing measurement is rounded to 4 decimal places.
+        """
+        from tqdm import tqdm
+
+        sizes = [10, 100, 1000, 10000, 20000, 100000]
+        time_data = []
+        epochs = 100
+
+        for i in tqdm(range(epochs), desc="Processing"):
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.random(s, 0, 100)
+
+                start = time.time()
+                arr.shell_sort()
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data)
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.ascending(s)
+
+                start = time.time()
+                arr.shell_sort()
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data)
+
+            time_data = []
+            for s in sizes:
+                arr = SortingArray.descending(s)
+
+                start = time.time()
+                arr.shell_sort()
+                end = time.time()
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data)
+
+    @staticmethod
+    def gen_insertion_sort_test_data():
+        """
+        Test the insert sort function, printing results for arrays of increaing sizes.
+        Creates arrays of different sizes and permutation of data.
+        """
+
+        sizes = [10, 100, 1000, 10000, 20000]
+        time_data = []
+        # Random Arrays
+        epochs = 100
+        for i in range(epochs):
+            print(f"Starting epoch{i}")
+            time_data = []
+            for s in sizes:
+                # Create Random Arrays
+                arr = SortingArray.random(s, 0, 100)
+
+                # Time the Algorithm
+                start = time.time()
+                arr.insertion_sort()
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("r", time_data)
+
+            # Already Sorted Arrays
+            time_data = []
+            for s in sizes:
+                # Create Ascending Order Arrays
+                arr = SortingArray.ascending(s)
+
+                # Time the Algorithm
+                start = time.time()
+                arr.insertion_sort()
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("a", time_data)
+
+            # Decreasing Order Arrays
+            time_data = []
+            for s in sizes:
+                # Create Descending Order Arrays
+                arr = SortingArray.descending(s)
+
+                # Time the Algorithm
+                start = time.time()
+                arr.insertion_sort()
+                end = time.time()
+
+                time_data.append(round(end - start, 4))
+            SortingArray.save_data("d", time_data)
+        print("Finished testing and saving.")
+
+
+def _sort_shared_range(task):
+    """
+    Pool worker for parallel_quick_sort: sort shared[low..high] in place.
+    """
+    shared, low, high = task
+    with shared._data[low:high + 1] as part:
+        SortingArray().three_way_quick_sort(part)
+    shared.close()
@@ -4,8 +4,8 @@
 # Defines an SortingArray class that sorts itself, extending
 # the Array class.
 
-# array.py must be in the same directory as this program
-from csarray import Array
+# the cs2 package must be installed (pip install -e . from the repo root)
+from cs2.csarray import Array
 import random
 import time
 